@@ -86,72 +86,157 @@ _SHT31_FREQUENCIES = (
     FREQUENCY_10,
 )
 
+# Bare-name const() assignments let MicroPython fold the command codes at
+# compile time; const() inside a tuple literal is not inlined.
+_SHT31_SINGLE_LOW = const(0x2416)
+_SHT31_SINGLE_MED = const(0x240B)
+_SHT31_SINGLE_HIGH = const(0x2400)
+_SHT31_SINGLE_LOW_CS = const(0x2C10)
+_SHT31_SINGLE_MED_CS = const(0x2C0D)
+_SHT31_SINGLE_HIGH_CS = const(0x2C06)
+
+_SHT31_ART = const(0x2B32)
+_SHT31_PERIODIC_LOW_0_5 = const(0x202F)
+_SHT31_PERIODIC_MED_0_5 = const(0x2024)
+_SHT31_PERIODIC_HIGH_0_5 = const(0x2032)
+_SHT31_PERIODIC_LOW_1 = const(0x212D)
+_SHT31_PERIODIC_MED_1 = const(0x2126)
+_SHT31_PERIODIC_HIGH_1 = const(0x2130)
+_SHT31_PERIODIC_LOW_2 = const(0x222B)
+_SHT31_PERIODIC_MED_2 = const(0x2220)
+_SHT31_PERIODIC_HIGH_2 = const(0x2236)
+_SHT31_PERIODIC_LOW_4 = const(0x2329)
+_SHT31_PERIODIC_MED_4 = const(0x2322)
+_SHT31_PERIODIC_HIGH_4 = const(0x2334)
+_SHT31_PERIODIC_LOW_10 = const(0x272A)
+_SHT31_PERIODIC_MED_10 = const(0x2721)
+_SHT31_PERIODIC_HIGH_10 = const(0x2737)
+
 _SINGLE_COMMANDS = (
-    (REP_LOW, const(False), const(0x2416)),
-    (REP_MED, const(False), const(0x240B)),
-    (REP_HIGH, const(False), const(0x2400)),
-    (REP_LOW, const(True), const(0x2C10)),
-    (REP_MED, const(True), const(0x2C0D)),
-    (REP_HIGH, const(True), const(0x2C06)),
+    (REP_LOW, False, _SHT31_SINGLE_LOW),
+    (REP_MED, False, _SHT31_SINGLE_MED),
+    (REP_HIGH, False, _SHT31_SINGLE_HIGH),
+    (REP_LOW, True, _SHT31_SINGLE_LOW_CS),
+    (REP_MED, True, _SHT31_SINGLE_MED_CS),
+    (REP_HIGH, True, _SHT31_SINGLE_HIGH_CS),
 )
 
 _PERIODIC_COMMANDS = (
-    (True, None, const(0x2B32)),
-    (REP_LOW, FREQUENCY_0_5, const(0x202F)),
-    (REP_MED, FREQUENCY_0_5, const(0x2024)),
-    (REP_HIGH, FREQUENCY_0_5, const(0x2032)),
-    (REP_LOW, FREQUENCY_1, const(0x212D)),
-    (REP_MED, FREQUENCY_1, const(0x2126)),
-    (REP_HIGH, FREQUENCY_1, const(0x2130)),
-    (REP_LOW, FREQUENCY_2, const(0x222B)),
-    (REP_MED, FREQUENCY_2, const(0x2220)),
-    (REP_HIGH, FREQUENCY_2, const(0x2236)),
-    (REP_LOW, FREQUENCY_4, const(0x2329)),
-    (REP_MED, FREQUENCY_4, const(0x2322)),
-    (REP_HIGH, FREQUENCY_4, const(0x2334)),
-    (REP_LOW, FREQUENCY_10, const(0x272A)),
-    (REP_MED, FREQUENCY_10, const(0x2721)),
-    (REP_HIGH, FREQUENCY_10, const(0x2737)),
+    (True, None, _SHT31_ART),
+    (REP_LOW, FREQUENCY_0_5, _SHT31_PERIODIC_LOW_0_5),
+    (REP_MED, FREQUENCY_0_5, _SHT31_PERIODIC_MED_0_5),
+    (REP_HIGH, FREQUENCY_0_5, _SHT31_PERIODIC_HIGH_0_5),
+    (REP_LOW, FREQUENCY_1, _SHT31_PERIODIC_LOW_1),
+    (REP_MED, FREQUENCY_1, _SHT31_PERIODIC_MED_1),
+    (REP_HIGH, FREQUENCY_1, _SHT31_PERIODIC_HIGH_1),
+    (REP_LOW, FREQUENCY_2, _SHT31_PERIODIC_LOW_2),
+    (REP_MED, FREQUENCY_2, _SHT31_PERIODIC_MED_2),
+    (REP_HIGH, FREQUENCY_2, _SHT31_PERIODIC_HIGH_2),
+    (REP_LOW, FREQUENCY_4, _SHT31_PERIODIC_LOW_4),
+    (REP_MED, FREQUENCY_4, _SHT31_PERIODIC_MED_4),
+    (REP_HIGH, FREQUENCY_4, _SHT31_PERIODIC_HIGH_4),
+    (REP_LOW, FREQUENCY_10, _SHT31_PERIODIC_LOW_10),
+    (REP_MED, FREQUENCY_10, _SHT31_PERIODIC_MED_10),
+    (REP_HIGH, FREQUENCY_10, _SHT31_PERIODIC_HIGH_10),
 )
 
 _DELAY = ((REP_LOW, 0.0045), (REP_MED, 0.0065), (REP_HIGH, 0.0155))
 
+# Only the soft reset and the periodic-mode break have datasheet-mandated
+# post-command delays; other commands may be followed immediately.
+_RESET_DELAY = 0.0015
+_BREAK_DELAY = 0.001
+
+# Conversion scale factors precomputed so each reading costs one
+# int-to-float conversion and a multiply instead of a float divide,
+# which is emulated in software on FPU-less boards.
+_TEMPERATURE_SCALE = 175.0 / 65535.0
+_HUMIDITY_SCALE = 100.0 / 65535.0
+
+# Lookup dicts built once at import so the hot paths resolve a command or
+# delay with a single hash lookup instead of scanning the tuples above.
+_SINGLE_CMD = {(rep, stretch): cmd for rep, stretch, cmd in _SINGLE_COMMANDS}
+_PERIODIC_CMD = {
+    (rep, freq): cmd for rep, freq, cmd in _PERIODIC_COMMANDS if rep is not True
+}
+_DELAY_MAP = dict(_DELAY)
+
+# In 'Single' mode, measurements requested within this window share one
+# I2C transaction so that reading temperature then relative_humidity
+# back-to-back only triggers a single measurement cycle.
+_SINGLE_CACHE_TTL = 0.05
+
+
+def _crc_byte(byte: int) -> int:
+    crc = byte
+    for _ in range(8):
+        if crc & 0x80:
+            crc <<= 1
+            crc ^= 0x31
+        else:
+            crc <<= 1
+    return crc & 0xFF
+
+
+# Table-driven CRC-8 (polynomial 0x31, init 0xFF) built once at import.
+# A bytes object keeps the table in flash on CircuitPython and makes each
+# byte of input a single indexed load instead of an 8-iteration bit loop.
+_CRC_TABLE = bytes(_crc_byte(i) for i in range(256))
+
 
 def _crc(data) -> int:
     crc = 0xFF
     for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 0x80:
-                crc <<= 1
-                crc ^= 0x31
-            else:
-                crc <<= 1
-    return crc & 0xFF
-
+        crc = _CRC_TABLE[crc ^ byte]
+    return crc
 
-def _unpack(data: ReadableBuffer) -> List[int]:
-    length = len(data)
-    crc = [None] * (length // 3)
-    word = [None] * (length // 3)
-    for i in range(length // 6):
-        word[i * 2], crc[i * 2], word[(i * 2) + 1], crc[(i * 2) + 1] = struct.unpack(
-            ">HBHB", data[i * 6 : (i * 6) + 6]
-        )
-        if crc[i * 2] == _crc(data[i * 6 : (i * 6) + 2]):
-            length = (i + 1) * 6
-    for i in range(length // 3):
-        if crc[i] != _crc(data[i * 3 : (i * 3) + 2]):
-            raise RuntimeError("CRC mismatch")
-    return word[: length // 3]
 
+def _crc2(byte1: int, byte2: int) -> int:
+    """CRC-8 of exactly two bytes, the only width the SHT31 ever sends.
 
-class SHT31D:
+    With init 0xFF the first byte enters the table as a plain XOR, so two
+    chained 256-entry lookups cover the whole message with no loop.
+    """
+    return _CRC_TABLE[_CRC_TABLE[0xFF ^ byte1] ^ byte2]
+
+
+def _unpack(data: ReadableBuffer, verify_crc: bool = True) -> List[int]:
+    mview = memoryview(data)
+    word = []
+    if not verify_crc:
+        # Trusted-bus fast path: the 'x' pads skip the CRC bytes entirely.
+        for i in range(len(mview) // 6):
+            temperature, humidity = struct.unpack_from(">HxHx", mview, i * 6)
+            word.append(temperature)
+            word.append(humidity)
+        return word
+    for i in range(len(mview) // 6):
+        temperature, temperature_crc, humidity, humidity_crc = struct.unpack_from(
+            ">HBHB", mview, i * 6
+        )
+        if temperature_crc != _crc2(
+            mview[i * 6], mview[(i * 6) + 1]
+        ) or humidity_crc != _crc2(mview[(i * 6) + 3], mview[(i * 6) + 4]):
+            if not word:
+                raise RuntimeError("CRC mismatch")
+            break
+        word.append(temperature)
+        word.append(humidity)
+    return word
+
+
+class SHT31D:  # pylint: disable=too-many-instance-attributes
     """
     A driver for the SHT31-D temperature and humidity sensor.
 
     :param ~busio.I2C i2c_bus: The I2C bus the SHT31-D is connected to
     :param int address: (optional) The I2C address of the device. Defaults to :const:`0x44`
+    :param bool verify_crc: (optional) Check the CRC byte of every measurement word.
+        Defaults to `True`. A bad CRC in the first frame of a reading raises
+        :class:`RuntimeError`; a bad CRC in a later 'Periodic' mode frame truncates
+        the returned lists at the last good frame. Set to `False` to skip the check
+        on a short, trusted bus; keep it enabled when debugging signal-integrity
+        issues.
 
     **Quickstart: Importing and using the SHT31-D**
 
@@ -181,23 +266,38 @@ class SHT31D:
 
     """
 
-    def __init__(self, i2c_bus: I2C, address: int = _SHT31_DEFAULT_ADDRESS) -> None:
+    def __init__(
+        self,
+        i2c_bus: I2C,
+        address: int = _SHT31_DEFAULT_ADDRESS,
+        verify_crc: bool = True,
+    ) -> None:
         if address not in _SHT31_ADDRESSES:
             raise ValueError(f"Invalid address: {hex(address)}")
         self.i2c_device = I2CDevice(i2c_bus, address)
+        self._verify_crc = bool(verify_crc)
+        # Preallocated buffers so the measurement paths never allocate,
+        # avoiding GC pauses in tight polling loops.
+        self._cmd_buf = bytearray(2)
+        self._buf2 = bytearray(2)
+        self._buf6 = bytearray(6)
+        self._buf48 = bytearray(48)
         self._mode = MODE_SINGLE
         self._repeatability = REP_HIGH
         self._frequency = FREQUENCY_4
         self._clock_stretching = False
         self._art = False
         self._last_read = 0
+        self._last_single_read = 0.0
         self._cached_temperature = None
         self._cached_humidity = None
         self._reset()
 
     def _command(self, command: int) -> None:
+        self._cmd_buf[0] = command >> 8
+        self._cmd_buf[1] = command & 0xFF
         with self.i2c_device as i2c:
-            i2c.write(struct.pack(">H", command))
+            i2c.write(self._cmd_buf)
 
     def _reset(self) -> None:
         """
@@ -206,51 +306,51 @@ class SHT31D:
         device will not respond to a soft reset when in 'Periodic' mode.
         """
         self._command(_SHT31_PERIODIC_BREAK)
-        time.sleep(0.001)
+        time.sleep(_BREAK_DELAY)
         self._command(_SHT31_SOFTRESET)
-        time.sleep(0.0015)
+        time.sleep(_RESET_DELAY)
 
     def _periodic(self) -> None:
-        for command in _PERIODIC_COMMANDS:
-            if self.art == command[0] or (
-                self.repeatability == command[0] and self.frequency == command[1]
-            ):
-                self._command(command[2])
-                time.sleep(0.001)
-                self._last_read = 0
+        if self._art:
+            self._command(_SHT31_ART)
+        else:
+            self._command(_PERIODIC_CMD[(self._repeatability, self._frequency)])
+        self._last_read = 0
 
     def _data(self) -> Union[Tuple[float, float], Tuple[List[float], List[float]]]:
         if self.mode == MODE_PERIODIC:
-            data = bytearray(48)
+            data = self._buf48
             data[0] = 0xFF
-            self._command(_SHT31_PERIODIC_FETCH)
-            time.sleep(0.001)
+            self._cmd_buf[0] = _SHT31_PERIODIC_FETCH >> 8
+            self._cmd_buf[1] = _SHT31_PERIODIC_FETCH & 0xFF
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(self._cmd_buf, data)
         elif self.mode == MODE_SINGLE:
-            data = bytearray(6)
+            data = self._buf6
             data[0] = 0xFF
-            for command in _SINGLE_COMMANDS:
-                if (
-                    self.repeatability == command[0]
-                    and self.clock_stretching == command[1]
-                ):
-                    self._command(command[2])
-            if not self.clock_stretching:
-                for delay in _DELAY:
-                    if self.repeatability == delay[0]:
-                        time.sleep(delay[1])
-            else:
-                time.sleep(0.001)
-        with self.i2c_device as i2c:
-            i2c.readinto(data)
-        word = _unpack(data)
-        length = len(word)
-        temperature = [None] * (length // 2)
-        humidity = [None] * (length // 2)
-        for i in range(length // 2):
-            temperature[i] = -45 + (175 * (word[i * 2] / 65535))
-            humidity[i] = 100 * (word[(i * 2) + 1] / 65535)
-        if (len(temperature) == 1) and (len(humidity) == 1):
-            return temperature[0], humidity[0]
+            command = _SINGLE_CMD[(self.repeatability, self.clock_stretching)]
+            self._cmd_buf[0] = command >> 8
+            self._cmd_buf[1] = command & 0xFF
+            # One context for command, conversion wait and read, so the bus
+            # lock is taken once per measurement instead of twice.
+            with self.i2c_device as i2c:
+                i2c.write(self._cmd_buf)
+                if not self.clock_stretching:
+                    time.sleep(_DELAY_MAP[self.repeatability])
+                else:
+                    time.sleep(0.001)
+                i2c.readinto(data)
+        word = _unpack(data, self._verify_crc)
+        if len(word) == 2:
+            return (
+                -45.0 + word[0] * _TEMPERATURE_SCALE,
+                word[1] * _HUMIDITY_SCALE,
+            )
+        temperature = []
+        humidity = []
+        for i in range(0, len(word), 2):
+            temperature.append(-45.0 + word[i] * _TEMPERATURE_SCALE)
+            humidity.append(word[i + 1] * _HUMIDITY_SCALE)
         return temperature, humidity
 
     def _read(self) -> Union[Tuple[float, float], Tuple[List[float], List[float]]]:
@@ -260,8 +360,12 @@ class SHT31D:
         ):
             self._cached_temperature, self._cached_humidity = self._data()
             self._last_read = time.time()
-        elif self.mode == MODE_SINGLE:
+        elif self.mode == MODE_SINGLE and (
+            self._cached_temperature is None
+            or time.monotonic() - self._last_single_read >= _SINGLE_CACHE_TTL
+        ):
             self._cached_temperature, self._cached_humidity = self._data()
+            self._last_single_read = time.monotonic()
         return self._cached_temperature, self._cached_humidity
 
     @property
@@ -279,10 +383,11 @@ class SHT31D:
             raise ValueError(f"Mode '{value}' not supported")
         if self._mode == MODE_PERIODIC and value != MODE_PERIODIC:
             self._command(_SHT31_PERIODIC_BREAK)
-            time.sleep(0.001)
+            time.sleep(_BREAK_DELAY)
         if value == MODE_PERIODIC and self._mode != MODE_PERIODIC:
             self._periodic()
         self._mode = value
+        self._last_single_read = 0.0
 
     @property
     def repeatability(self) -> Literal["High", "Medium", "Low"]:
@@ -301,6 +406,7 @@ class SHT31D:
             self._periodic()
         else:
             self._repeatability = value
+        self._last_single_read = 0.0
 
     @property
     def clock_stretching(self) -> bool:
@@ -313,6 +419,7 @@ class SHT31D:
     @clock_stretching.setter
     def clock_stretching(self, value: bool) -> None:
         self._clock_stretching = bool(value)
+        self._last_single_read = 0.0
 
     @property
     def art(self) -> bool:
@@ -358,6 +465,10 @@ class SHT31D:
         """
         The measured temperature in degrees Celsius.
         'Single' mode reads and returns the current temperature as a float.
+        Reads within ``_SINGLE_CACHE_TTL`` (50 ms) of the previous
+        measurement return the cached value without touching the bus, so
+        reading temperature then relative_humidity back-to-back costs one
+        measurement cycle.
         'Periodic' mode returns the most recent readings available from the sensor's cache
         in a FILO list of eight floats. This list is backfilled with with the
         sensor's maximum output of 130.0 when the sensor is read before the
@@ -371,6 +482,10 @@ class SHT31D:
         """
         The measured relative humidity in percent.
         'Single' mode reads and returns the current humidity as a float.
+        Reads within ``_SINGLE_CACHE_TTL`` (50 ms) of the previous
+        measurement return the cached value without touching the bus, so
+        reading temperature then relative_humidity back-to-back costs one
+        measurement cycle.
         'Periodic' mode returns the most recent readings available from the sensor's cache
         in a FILO list of eight floats. This list is backfilled with with the
         sensor's maximum output of 100.01831417975366 when the sensor is read
@@ -379,6 +494,17 @@ class SHT31D:
         _, humidity = self._read()
         return humidity
 
+    @property
+    # Longer than pylint's attribute-name cap, but kept for API clarity.
+    def temperature_and_relative_humidity(  # pylint: disable=invalid-name
+        self,
+    ) -> Union[Tuple[float, float], Tuple[List[float], List[float]]]:
+        """
+        The measured temperature in degrees Celsius and relative humidity
+        in percent, from a single measurement cycle.
+        """
+        return self._read()
+
     @property
     def heater(self) -> bool:
         """Control device's internal heater."""
@@ -388,30 +514,28 @@ class SHT31D:
     def heater(self, value: bool = False) -> None:
         if value:
             self._command(_SHT31_HEATER_ENABLE)
-            time.sleep(0.001)
         else:
             self._command(_SHT31_HEATER_DISABLE)
-            time.sleep(0.001)
 
     @property
     def status(self) -> int:
         """Device status."""
-        data = bytearray(2)
-        self._command(_SHT31_READSTATUS)
-        time.sleep(0.001)
+        data = self._buf2
+        self._cmd_buf[0] = _SHT31_READSTATUS >> 8
+        self._cmd_buf[1] = _SHT31_READSTATUS & 0xFF
         with self.i2c_device as i2c:
-            i2c.readinto(data)
+            i2c.write_then_readinto(self._cmd_buf, data)
         status = data[0] << 8 | data[1]
         return status
 
     @property
     def serial_number(self) -> int:
         """Device serial number."""
-        data = bytearray(6)
+        data = self._buf6
         data[0] = 0xFF
-        self._command(_SHT31_READSERIALNBR)
-        time.sleep(0.001)
+        self._cmd_buf[0] = _SHT31_READSERIALNBR >> 8
+        self._cmd_buf[1] = _SHT31_READSERIALNBR & 0xFF
         with self.i2c_device as i2c:
-            i2c.readinto(data)
+            i2c.write_then_readinto(self._cmd_buf, data)
         word = _unpack(data)
         return (word[0] << 16) | word[1]